@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import secrets
-from collections.abc import Callable
-from typing import Any, Literal, Protocol, TypeVar
+import time
+from importlib import resources
+from typing import Any, Final, Literal, Protocol
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from pydantic import BaseModel, Field
 
 from agent_vault.manifest import ManifestError
@@ -14,7 +19,43 @@ from agent_vault.models import Manifest
 from agent_vault.service import ProviderStatus, ProviderTestResult, ServiceError
 from agent_vault.vault import VaultError
 
-T = TypeVar("T")
+_DASHBOARD_TEMPLATE: Final[str] = (
+    resources.files("agent_vault").joinpath("dashboard.html").read_text(encoding="utf-8")
+)
+_READ_CACHE_TTL_SECONDS: Final[float] = 1.0
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+class _ResponseCache:
+    """Short-lived cache of serialized read responses, cleared on every write."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, bytes]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, key: str, body: bytes, generation: int) -> None:
+        # Drop results computed before a write landed.
+        if generation == self._generation:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, body)
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._entries.clear()
 
 
 class SecretWriteRequest(BaseModel):
@@ -25,6 +66,7 @@ class ManifestUpdateRequest(BaseModel):
     manifest: Manifest
 
 
+# Schema-only models: these routes return pre-serialized bodies.
 class ProviderResponse(BaseModel):
     name: str
     type: str
@@ -36,6 +78,14 @@ class ProviderResponse(BaseModel):
     endpoint_reachable: bool | None
 
 
+class ProviderListResponse(BaseModel):
+    providers: list[ProviderResponse]
+
+
+class ManifestResponse(BaseModel):
+    manifest: Manifest
+
+
 class ProviderTestResponse(BaseModel):
     provider: str
     ok: bool
@@ -58,870 +108,170 @@ class DashboardService(Protocol):
 
 
 def create_app(service: DashboardService, auth_token: str) -> FastAPI:
-    app = FastAPI(title="Agent Vault Local API", version="0.1.0")
+    app = FastAPI(
+        title="Agent Vault Local API",
+        version="0.1.0",
+        default_response_class=ORJSONResponse,
+    )
+    app.add_exception_handler(ManifestError, _bad_request_handler)
+    app.add_exception_handler(ServiceError, _bad_request_handler)
+    app.add_exception_handler(VaultError, _vault_error_handler)
+
+    dashboard_body = _dashboard_html(auth_token).encode("utf-8")
+    dashboard_body_gzip = gzip.compress(dashboard_body, compresslevel=9, mtime=0)
+    token_tag_key = secrets.token_bytes(16)
+    expected_token_tag = _token_tag(auth_token.encode("utf-8"), token_tag_key)
+    read_cache = _ResponseCache(_READ_CACHE_TTL_SECONDS)
     share_counters: dict[str, int] = {
         "manifest_share_link_copied": 0,
         "manifest_share_link_imported": 0,
     }
 
     def require_write_token(request: Request) -> None:
-        provided = request.headers.get("X-Agent-Vault-Token")
-        if not provided or not secrets.compare_digest(provided, auth_token):
+        provided = request.headers.get("X-Agent-Vault-Token", "").encode("utf-8")
+        provided_tag = _token_tag(provided, token_tag_key)
+        if not provided or not secrets.compare_digest(provided_tag, expected_token_tag):
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-    def run_service_call(fn: Callable[[], T]) -> T:
-        try:
-            return fn()
-        except ManifestError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        except ServiceError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        except VaultError as exc:
-            raise HTTPException(status_code=500, detail=str(exc)) from exc
-
-    @app.get("/", response_class=HTMLResponse)
-    def dashboard() -> str:
-        return _dashboard_html(auth_token)
+    @app.get("/", response_class=HTMLResponse, response_model=None)
+    async def dashboard(request: Request) -> HTMLResponse:
+        body = dashboard_body
+        headers = {"Vary": "Accept-Encoding"}
+        if _accepts_gzip(request.headers.get("accept-encoding", "")):
+            body = dashboard_body_gzip
+            headers["Content-Encoding"] = "gzip"
+        return HTMLResponse(body, headers=headers)
 
     @app.get("/health")
-    def health() -> dict[str, str]:
+    async def health() -> dict[str, str]:
         return {"status": "ok"}
 
-    @app.get("/providers")
-    def list_providers() -> dict[str, list[ProviderResponse]]:
-        statuses = run_service_call(service.list_provider_statuses)
-        providers = [_provider_response(item) for item in statuses]
-        return {"providers": providers}
+    @app.get(
+        "/providers",
+        response_class=ORJSONResponse,
+        response_model=None,
+        responses={200: {"model": ProviderListResponse}},
+    )
+    async def list_providers() -> Response:
+        body = read_cache.get("providers")
+        if body is None:
+            generation = read_cache.generation
+            statuses = await run_in_threadpool(service.list_provider_statuses)
+            body = orjson.dumps({"providers": [item.as_public_dict() for item in statuses]})
+            read_cache.put("providers", body, generation)
+        return Response(body, media_type="application/json")
 
     @app.post("/providers/{provider}/secret")
-    def set_provider_secret(
+    async def set_provider_secret(
         provider: str,
         payload: SecretWriteRequest,
         request: Request,
     ) -> dict[str, str]:
         require_write_token(request)
-        run_service_call(lambda: service.set_provider_secret(provider, payload.secret))
+        await run_in_threadpool(service.set_provider_secret, provider, payload.secret)
+        read_cache.invalidate()
         return {"status": "stored"}
 
     @app.delete("/providers/{provider}/secret")
-    def delete_provider_secret(provider: str, request: Request) -> dict[str, bool]:
+    async def delete_provider_secret(provider: str, request: Request) -> dict[str, bool]:
         require_write_token(request)
-        deleted = run_service_call(lambda: service.delete_provider_secret(provider))
+        deleted = await run_in_threadpool(service.delete_provider_secret, provider)
+        read_cache.invalidate()
         return {"deleted": deleted}
 
-    @app.post("/providers/{provider}/test")
-    def test_provider(provider: str) -> ProviderTestResponse:
-        result = run_service_call(lambda: service.test_provider(provider))
-        return _test_response(result)
-
-    @app.get("/manifest")
-    def get_manifest() -> dict[str, Any]:
-        manifest = run_service_call(service.load_manifest)
-        return {"manifest": manifest.model_dump(mode="json")}
+    @app.post(
+        "/providers/{provider}/test",
+        response_class=ORJSONResponse,
+        response_model=None,
+        responses={200: {"model": ProviderTestResponse}},
+    )
+    async def test_provider(provider: str) -> Response:
+        result = await run_in_threadpool(service.test_provider, provider)
+        return Response(orjson.dumps(_test_dict(result)), media_type="application/json")
+
+    @app.get(
+        "/manifest",
+        response_class=ORJSONResponse,
+        response_model=None,
+        responses={200: {"model": ManifestResponse}},
+    )
+    async def get_manifest() -> Response:
+        body = read_cache.get("manifest")
+        if body is None:
+            generation = read_cache.generation
+            manifest = await run_in_threadpool(service.load_manifest)
+            body = b'{"manifest":' + manifest.model_dump_json().encode("utf-8") + b"}"
+            read_cache.put("manifest", body, generation)
+        return Response(body, media_type="application/json")
 
     @app.put("/manifest")
-    def update_manifest(payload: ManifestUpdateRequest, request: Request) -> dict[str, str]:
+    async def update_manifest(payload: ManifestUpdateRequest, request: Request) -> dict[str, str]:
         require_write_token(request)
-        run_service_call(lambda: service.save_manifest(payload.manifest))
+        await run_in_threadpool(service.save_manifest, payload.manifest)
+        read_cache.invalidate()
         return {"status": "updated"}
 
     @app.post("/events/share")
-    def track_share_event(payload: ShareEventRequest, request: Request) -> dict[str, str]:
+    async def track_share_event(payload: ShareEventRequest, request: Request) -> dict[str, str]:
         require_write_token(request)
         share_counters[payload.event] += 1
         return {"status": "tracked"}
 
     @app.get("/metrics/share")
-    def get_share_metrics() -> dict[str, dict[str, int]]:
+    async def get_share_metrics() -> dict[str, dict[str, int]]:
         return {"counters": dict(share_counters)}
 
     return app
 
 
-def _provider_response(status: ProviderStatus) -> ProviderResponse:
-    return ProviderResponse(
-        name=status.name,
-        type=status.provider_type,
-        env_var=status.env_var,
-        vault_key=status.vault_key,
-        endpoint=status.endpoint,
-        priority=status.priority,
-        has_secret=status.has_secret,
-        endpoint_reachable=status.endpoint_reachable,
-    )
+def _token_tag(token: bytes, key: bytes) -> bytes:
+    # Fixed-size tags make the comparison independent of the provided token's length.
+    return hashlib.blake2b(token, digest_size=16, key=key).digest()
 
 
-def _test_response(result: ProviderTestResult) -> ProviderTestResponse:
-    return ProviderTestResponse(
-        provider=result.provider,
-        ok=result.ok,
-        has_secret=result.has_secret,
-        endpoint_reachable=result.endpoint_reachable,
-        failures=list(result.failures),
-    )
+async def _bad_request_handler(request: Request, exc: Exception) -> Response:
+    return ORJSONResponse({"detail": str(exc)}, status_code=400)
+
+
+async def _vault_error_handler(request: Request, exc: Exception) -> Response:
+    return ORJSONResponse({"detail": str(exc)}, status_code=500)
+
+
+def _test_dict(result: ProviderTestResult) -> dict[str, Any]:
+    return {
+        "provider": result.provider,
+        "ok": result.ok,
+        "has_secret": result.has_secret,
+        "endpoint_reachable": result.endpoint_reachable,
+        "failures": list(result.failures),
+    }
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    # An explicit gzip entry wins over "*". A missing q means 1; a malformed one refuses.
+    wildcard: bool | None = None
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if coding not in {"gzip", "*"}:
+            continue
+        accepted = _quality(params) > 0
+        if coding == "gzip":
+            return accepted
+        wildcard = accepted
+    return bool(wildcard)
+
+
+def _quality(params: list[str]) -> float:
+    for param in params:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value.strip())
+            except ValueError:
+                return 0.0
+    return 1.0
 
 
 def _dashboard_html(auth_token: str) -> str:
-    token_json = json.dumps(auth_token)
-    return """<!doctype html>
-<html lang="en">
-  <head>
-    <meta charset="utf-8" />
-    <meta name="viewport" content="width=device-width, initial-scale=1" />
-    <title>Agent Vault Dashboard</title>
-    <style>
-      :root {
-        color-scheme: light;
-        --bg-main: #f2f6fa;
-        --bg-accent: #c7ecf2;
-        --bg-secondary: #d6dff9;
-        --surface: rgba(255, 255, 255, 0.86);
-        --surface-strong: #ffffff;
-        --line: #d4dde9;
-        --line-strong: #bec9da;
-        --text: #10243d;
-        --text-muted: #4b6180;
-        --accent: #1d6fd7;
-        --accent-strong: #085fca;
-        --ok: #227f4a;
-        --warn: #b27700;
-        --danger: #b0373c;
-        --shadow: 0 16px 30px rgba(16, 36, 61, 0.08);
-      }
-
-      :root[data-theme="dark"] {
-        color-scheme: dark;
-        --bg-main: #3a4151;
-        --bg-accent: #495165;
-        --bg-secondary: #2f3644;
-        --surface: rgba(50, 58, 73, 0.86);
-        --surface-strong: #41495b;
-        --line: #55607a;
-        --line-strong: #67728d;
-        --text: #edf2fb;
-        --text-muted: #b2bdd2;
-        --accent: #8fa9db;
-        --accent-strong: #7d99cf;
-        --ok: #a9d49e;
-        --warn: #e4c07b;
-        --danger: #ef9fa7;
-        --shadow: 0 20px 40px rgba(13, 17, 24, 0.4);
-      }
-
-      * {
-        box-sizing: border-box;
-      }
-
-      body {
-        margin: 0;
-        min-height: 100vh;
-        font-family: "Space Grotesk", "Avenir Next", "Segoe UI", sans-serif;
-        color: var(--text);
-        background:
-          radial-gradient(1200px 540px at 5% -5%, var(--bg-accent), transparent 65%),
-          radial-gradient(900px 420px at 100% 0%, var(--bg-secondary), transparent 58%),
-          var(--bg-main);
-      }
-
-      .wrap {
-        max-width: 1220px;
-        margin: 0 auto;
-        padding: 22px 16px 36px;
-      }
-
-      .hero {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        gap: 16px;
-        margin-bottom: 16px;
-        padding: 18px;
-        border: 1px solid var(--line);
-        border-radius: 20px;
-        background: var(--surface);
-        backdrop-filter: blur(16px);
-        box-shadow: var(--shadow);
-      }
-
-      .title {
-        margin: 0;
-        font-size: clamp(1.5rem, 2.5vw, 2.1rem);
-        letter-spacing: 0.02em;
-      }
-
-      .subtitle {
-        margin: 6px 0 0;
-        color: var(--text-muted);
-        font-size: 0.95rem;
-      }
-
-      .hero-actions {
-        display: flex;
-        align-items: center;
-        gap: 10px;
-      }
-
-      .theme-state {
-        font-size: 0.82rem;
-        color: var(--text-muted);
-      }
-
-      .layout {
-        display: grid;
-        gap: 16px;
-        grid-template-columns: minmax(0, 1.65fr) minmax(0, 1fr);
-      }
-
-      .panel {
-        border: 1px solid var(--line);
-        border-radius: 20px;
-        padding: 16px;
-        background: var(--surface);
-        backdrop-filter: blur(16px);
-        box-shadow: var(--shadow);
-      }
-
-      .panel-head {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        gap: 10px;
-        margin-bottom: 12px;
-      }
-
-      .panel-title {
-        margin: 0;
-        font-size: 1.1rem;
-        letter-spacing: 0.02em;
-      }
-
-      .controls {
-        display: flex;
-        gap: 8px;
-      }
-
-      .table-shell {
-        border: 1px solid var(--line);
-        border-radius: 14px;
-        overflow: hidden;
-        background: var(--surface-strong);
-      }
-
-      table {
-        width: 100%;
-        border-collapse: collapse;
-      }
-
-      th,
-      td {
-        text-align: left;
-        padding: 12px 10px;
-        border-bottom: 1px solid var(--line);
-        vertical-align: top;
-      }
-
-      th {
-        font-size: 0.77rem;
-        text-transform: uppercase;
-        letter-spacing: 0.08em;
-        color: var(--text-muted);
-      }
-
-      tr:last-child td {
-        border-bottom: none;
-      }
-
-      .provider-name {
-        display: block;
-        font-weight: 600;
-      }
-
-      .provider-meta {
-        display: block;
-        color: var(--text-muted);
-        font-size: 0.77rem;
-        margin-top: 2px;
-      }
-
-      .status-badge {
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        gap: 4px;
-        min-width: 72px;
-        padding: 4px 10px;
-        border-radius: 999px;
-        border: 1px solid var(--line-strong);
-        font-size: 0.76rem;
-        text-transform: uppercase;
-        letter-spacing: 0.04em;
-      }
-
-      .status-ok {
-        border-color: color-mix(in srgb, var(--ok) 42%, var(--line) 58%);
-        color: var(--ok);
-      }
-
-      .status-warn {
-        border-color: color-mix(in srgb, var(--warn) 42%, var(--line) 58%);
-        color: var(--warn);
-      }
-
-      .status-missing {
-        border-color: color-mix(in srgb, var(--danger) 42%, var(--line) 58%);
-        color: var(--danger);
-      }
-
-      .row-actions {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 7px;
-      }
-
-      button {
-        appearance: none;
-        border: 1px solid var(--line-strong);
-        border-radius: 11px;
-        padding: 8px 11px;
-        background: transparent;
-        color: var(--text);
-        cursor: pointer;
-        font-weight: 600;
-        letter-spacing: 0.01em;
-      }
-
-      button:hover {
-        border-color: var(--accent);
-      }
-
-      button:disabled {
-        opacity: 0.55;
-        cursor: default;
-      }
-
-      button.primary {
-        background: var(--accent);
-        border-color: var(--accent);
-        color: #ffffff;
-      }
-
-      button.primary:hover {
-        background: var(--accent-strong);
-        border-color: var(--accent-strong);
-      }
-
-      button.danger {
-        color: var(--danger);
-      }
-
-      #status {
-        margin-top: 12px;
-        min-height: 44px;
-        padding: 10px 12px;
-        border-radius: 12px;
-        border: 1px solid var(--line);
-        background: var(--surface-strong);
-        white-space: pre-wrap;
-        font-size: 0.91rem;
-      }
-
-      #status[data-level="success"] {
-        border-color: color-mix(in srgb, var(--ok) 55%, var(--line) 45%);
-      }
-
-      #status[data-level="error"] {
-        border-color: color-mix(in srgb, var(--danger) 55%, var(--line) 45%);
-      }
-
-      textarea {
-        width: 100%;
-        min-height: 480px;
-        resize: vertical;
-        border-radius: 14px;
-        border: 1px solid var(--line);
-        background: var(--surface-strong);
-        color: var(--text);
-        padding: 12px;
-        font-size: 0.86rem;
-        line-height: 1.4;
-        font-family: "JetBrains Mono", "Fira Code", "SFMono-Regular", "Menlo", monospace;
-      }
-
-      .manifest-note {
-        margin: 0 0 10px;
-        color: var(--text-muted);
-        font-size: 0.84rem;
-      }
-
-      .share-metrics {
-        margin: 0 0 12px;
-        color: var(--text-muted);
-        font-size: 0.8rem;
-      }
-
-      @media (max-width: 1040px) {
-        .layout {
-          grid-template-columns: 1fr;
-        }
-
-        textarea {
-          min-height: 340px;
-        }
-      }
-
-      @media (max-width: 700px) {
-        .hero {
-          align-items: flex-start;
-          flex-direction: column;
-        }
-
-        .hero-actions {
-          width: 100%;
-          justify-content: space-between;
-        }
-
-        th,
-        td {
-          padding: 10px 8px;
-        }
-      }
-    </style>
-  </head>
-  <body>
-    <main class="wrap">
-      <header class="hero">
-        <div>
-          <h1 class="title">Agent Vault Control Panel</h1>
-          <p class="subtitle">Manage providers, rotate secrets, and edit manifest metadata from one local UI.</p>
-        </div>
-        <div class="hero-actions">
-          <span class="theme-state" id="theme-state">Theme: auto</span>
-          <button id="theme-toggle" type="button">Switch theme</button>
-        </div>
-      </header>
-
-      <section class="layout">
-        <article class="panel">
-          <div class="panel-head">
-            <h2 class="panel-title">Providers</h2>
-            <div class="controls">
-              <button id="refresh-providers" type="button">Refresh</button>
-            </div>
-          </div>
-
-          <div class="table-shell">
-            <table>
-              <thead>
-                <tr>
-                  <th>Provider</th>
-                  <th>Type</th>
-                  <th>Secret</th>
-                  <th>Endpoint</th>
-                  <th>Actions</th>
-                </tr>
-              </thead>
-              <tbody id="providers-body"></tbody>
-            </table>
-          </div>
-          <div id="status" data-level="info">Loading dashboard...</div>
-        </article>
-
-        <article class="panel">
-          <div class="panel-head">
-            <h2 class="panel-title">Manifest</h2>
-            <div class="controls">
-              <button id="copy-share-link" type="button">Copy Share Link</button>
-              <button id="refresh-manifest" type="button">Reload</button>
-              <button class="primary" id="save-manifest" type="button">Save</button>
-            </div>
-          </div>
-          <p class="manifest-note">Only metadata is stored here. Secret values stay in your OS key vault.</p>
-          <p class="share-metrics" id="share-metrics">Share copies: 0 | Share imports: 0</p>
-          <textarea id="manifest-json" spellcheck="false" aria-label="Manifest JSON"></textarea>
-        </article>
-      </section>
-    </main>
-
-    <script>
-      const authToken = __AUTH_TOKEN__;
-      const THEME_STORAGE_KEY = "agent-vault-theme";
-      const rootEl = document.documentElement;
-      const providersBody = document.getElementById("providers-body");
-      const statusEl = document.getElementById("status");
-      const manifestEl = document.getElementById("manifest-json");
-      const copyShareLinkBtn = document.getElementById("copy-share-link");
-      const shareMetricsEl = document.getElementById("share-metrics");
-      const refreshProvidersBtn = document.getElementById("refresh-providers");
-      const refreshManifestBtn = document.getElementById("refresh-manifest");
-      const saveManifestBtn = document.getElementById("save-manifest");
-      const themeToggleBtn = document.getElementById("theme-toggle");
-      const themeStateEl = document.getElementById("theme-state");
-      const darkPreference = window.matchMedia("(prefers-color-scheme: dark)");
-
-      function getInitialTheme() {
-        const stored = window.localStorage.getItem(THEME_STORAGE_KEY);
-        if (stored === "light" || stored === "dark") {
-          return stored;
-        }
-        return darkPreference.matches ? "dark" : "light";
-      }
-
-      function applyTheme(theme) {
-        rootEl.setAttribute("data-theme", theme);
-        themeStateEl.textContent = `Theme: ${theme}`;
-        themeToggleBtn.textContent = theme === "dark" ? "Use light mode" : "Use dark mode";
-      }
-
-      function setTheme(theme) {
-        applyTheme(theme);
-        window.localStorage.setItem(THEME_STORAGE_KEY, theme);
-      }
-
-      function toggleTheme() {
-        const current = rootEl.getAttribute("data-theme") || "light";
-        setTheme(current === "dark" ? "light" : "dark");
-      }
-
-      function setStatus(message, level = "info") {
-        statusEl.textContent = message;
-        statusEl.setAttribute("data-level", level);
-      }
-
-      async function apiRequest(path, options = {}) {
-        const response = await fetch(path, options);
-        const body = await response.json().catch(() => ({}));
-        if (!response.ok) {
-          throw new Error(body.detail || "Request failed");
-        }
-        return body;
-      }
-
-      function toBase64Url(value) {
-        return btoa(value).replaceAll("+", "-").replaceAll("/", "_").replace(/=+$/, "");
-      }
-
-      function fromBase64Url(value) {
-        const normalized = value.replace(/-/g, "+").replace(/_/g, "/");
-        const padding = normalized.length % 4 ? "=".repeat(4 - (normalized.length % 4)) : "";
-        return atob(normalized + padding);
-      }
-
-      function encodeManifestShare(manifest) {
-        const bytes = new TextEncoder().encode(JSON.stringify(manifest));
-        let binary = "";
-        for (const byte of bytes) {
-          binary += String.fromCharCode(byte);
-        }
-        return toBase64Url(binary);
-      }
-
-      function decodeManifestShare(payload) {
-        const binary = fromBase64Url(payload);
-        const bytes = Uint8Array.from(binary, char => char.charCodeAt(0));
-        return JSON.parse(new TextDecoder().decode(bytes));
-      }
-
-      async function trackShareEvent(eventName) {
-        await apiRequest("/events/share", {
-          method: "POST",
-          headers: {
-            "Content-Type": "application/json",
-            "X-Agent-Vault-Token": authToken
-          },
-          body: JSON.stringify({ event: eventName })
-        });
-      }
-
-      async function loadShareMetrics() {
-        const data = await apiRequest("/metrics/share");
-        const copied = data.counters?.manifest_share_link_copied ?? 0;
-        const imported = data.counters?.manifest_share_link_imported ?? 0;
-        shareMetricsEl.textContent = `Share copies: ${copied} | Share imports: ${imported}`;
-      }
-
-      async function copyManifestShareLink() {
-        const manifest = JSON.parse(manifestEl.value);
-        const shareUrl = new URL(window.location.href);
-        shareUrl.searchParams.set("manifest_share", encodeManifestShare(manifest));
-        const value = shareUrl.toString();
-
-        if (window.navigator.clipboard?.writeText) {
-          await window.navigator.clipboard.writeText(value);
-        } else {
-          window.prompt("Copy this manifest share link", value);
-        }
-
-        await trackShareEvent("manifest_share_link_copied");
-        await loadShareMetrics();
-        setStatus("Share link copied. Send it to a teammate and they can import this manifest draft.", "success");
-      }
-
-      async function applySharedManifestFromUrl() {
-        const url = new URL(window.location.href);
-        const shared = url.searchParams.get("manifest_share");
-        if (!shared) return false;
-
-        const importedManifest = decodeManifestShare(shared);
-        manifestEl.value = JSON.stringify(importedManifest, null, 2);
-        await trackShareEvent("manifest_share_link_imported");
-        await loadShareMetrics();
-
-        url.searchParams.delete("manifest_share");
-        window.history.replaceState({}, "", url.toString());
-        setStatus("Shared manifest loaded. Review and click Save to apply it locally.", "success");
-        return true;
-      }
-
-      function statusBadge(text, variant) {
-        const span = document.createElement("span");
-        span.className = `status-badge ${variant}`;
-        span.textContent = text;
-        return span;
-      }
-
-      function withBusy(button, label, fn) {
-        return async () => {
-          const previous = button.textContent;
-          button.disabled = true;
-          button.textContent = label;
-          try {
-            await fn();
-          } finally {
-            button.disabled = false;
-            button.textContent = previous;
-          }
-        };
-      }
-
-      function endpointSummary(provider) {
-        if (!provider.endpoint) {
-          return "-";
-        }
-        if (provider.endpoint_reachable === true) {
-          return `${provider.endpoint} (ok)`;
-        }
-        if (provider.endpoint_reachable === false) {
-          return `${provider.endpoint} (down)`;
-        }
-        return provider.endpoint;
-      }
-
-      function createProviderCell(provider) {
-        const td = document.createElement("td");
-        const name = document.createElement("span");
-        name.className = "provider-name";
-        name.textContent = provider.name;
-        td.appendChild(name);
-        if (provider.vault_key || provider.env_var) {
-          const meta = document.createElement("span");
-          meta.className = "provider-meta";
-          const parts = [];
-          if (provider.vault_key) parts.push(`vault: ${provider.vault_key}`);
-          if (provider.env_var) parts.push(`env: ${provider.env_var}`);
-          meta.textContent = parts.join(" | ");
-          td.appendChild(meta);
-        }
-        return td;
-      }
-
-      async function loadProviders() {
-        const data = await apiRequest("/providers");
-        providersBody.innerHTML = "";
-
-        if (!data.providers.length) {
-          const emptyRow = document.createElement("tr");
-          const emptyCell = document.createElement("td");
-          emptyCell.colSpan = 5;
-          emptyCell.textContent = "No providers configured in manifest.";
-          emptyRow.appendChild(emptyCell);
-          providersBody.appendChild(emptyRow);
-          return;
-        }
-
-        for (const provider of data.providers) {
-          const tr = document.createElement("tr");
-          tr.appendChild(createProviderCell(provider));
-
-          const typeTd = document.createElement("td");
-          typeTd.appendChild(statusBadge(provider.type || "unknown", "status-warn"));
-          tr.appendChild(typeTd);
-
-          const secretTd = document.createElement("td");
-          if (provider.has_secret === true) {
-            secretTd.appendChild(statusBadge("present", "status-ok"));
-          } else if (provider.has_secret === false) {
-            secretTd.appendChild(statusBadge("missing", "status-missing"));
-          } else {
-            secretTd.appendChild(statusBadge("n/a", "status-warn"));
-          }
-          tr.appendChild(secretTd);
-
-          const endpointTd = document.createElement("td");
-          endpointTd.textContent = endpointSummary(provider);
-          tr.appendChild(endpointTd);
-
-          const actionsTd = document.createElement("td");
-          const actions = document.createElement("div");
-          actions.className = "row-actions";
-
-          const setBtn = document.createElement("button");
-          setBtn.className = "primary";
-          setBtn.textContent = "Set / Rotate";
-          setBtn.addEventListener(
-            "click",
-            withBusy(setBtn, "Saving...", async () => {
-              const secret = window.prompt(`Enter secret for ${provider.name}`);
-              if (secret === null) return;
-              if (!secret.trim()) {
-                setStatus("Secret cannot be empty", "error");
-                return;
-              }
-              await apiRequest(`/providers/${encodeURIComponent(provider.name)}/secret`, {
-                method: "POST",
-                headers: {
-                  "Content-Type": "application/json",
-                  "X-Agent-Vault-Token": authToken
-                },
-                body: JSON.stringify({ secret })
-              });
-              setStatus(`Secret stored for ${provider.name}`, "success");
-              await loadProviders();
-            })
-          );
-          actions.appendChild(setBtn);
-
-          const delBtn = document.createElement("button");
-          delBtn.className = "danger";
-          delBtn.textContent = "Delete";
-          delBtn.addEventListener(
-            "click",
-            withBusy(delBtn, "Deleting...", async () => {
-              const confirmed = window.confirm(`Delete secret for ${provider.name}?`);
-              if (!confirmed) return;
-              const result = await apiRequest(`/providers/${encodeURIComponent(provider.name)}/secret`, {
-                method: "DELETE",
-                headers: {
-                  "X-Agent-Vault-Token": authToken
-                }
-              });
-              setStatus(
-                result.deleted
-                  ? `Secret deleted for ${provider.name}`
-                  : `No secret found for ${provider.name}`,
-                result.deleted ? "success" : "info"
-              );
-              await loadProviders();
-            })
-          );
-          actions.appendChild(delBtn);
-
-          const testBtn = document.createElement("button");
-          testBtn.textContent = "Test";
-          testBtn.addEventListener(
-            "click",
-            withBusy(testBtn, "Testing...", async () => {
-              const result = await apiRequest(`/providers/${encodeURIComponent(provider.name)}/test`, {
-                method: "POST"
-              });
-              if (result.ok) {
-                setStatus(`Provider test succeeded: ${provider.name}`, "success");
-              } else {
-                const details = result.failures.length ? result.failures.join(", ") : "unknown failure";
-                setStatus(`Provider test failed: ${provider.name} (${details})`, "error");
-              }
-              await loadProviders();
-            })
-          );
-          actions.appendChild(testBtn);
-
-          actionsTd.appendChild(actions);
-          tr.appendChild(actionsTd);
-          providersBody.appendChild(tr);
-        }
-      }
-
-      async function loadManifest() {
-        const data = await apiRequest("/manifest");
-        manifestEl.value = JSON.stringify(data.manifest, null, 2);
-      }
-
-      async function refreshProviders() {
-        try {
-          await loadProviders();
-          setStatus("Provider list refreshed", "info");
-        } catch (error) {
-          setStatus(error.message, "error");
-        }
-      }
-
-      refreshProvidersBtn.addEventListener("click", refreshProviders);
-      themeToggleBtn.addEventListener("click", toggleTheme);
-      copyShareLinkBtn.addEventListener(
-        "click",
-        withBusy(copyShareLinkBtn, "Copying...", async () => {
-          try {
-            await copyManifestShareLink();
-          } catch (error) {
-            setStatus(error.message, "error");
-          }
-        })
-      );
-
-      darkPreference.addEventListener("change", () => {
-        if (!window.localStorage.getItem(THEME_STORAGE_KEY)) {
-          applyTheme(darkPreference.matches ? "dark" : "light");
-        }
-      });
-
-      refreshManifestBtn.addEventListener("click", async () => {
-        try {
-          await loadManifest();
-          setStatus("Manifest reloaded", "info");
-        } catch (error) {
-          setStatus(error.message, "error");
-        }
-      });
-
-      saveManifestBtn.addEventListener(
-        "click",
-        withBusy(saveManifestBtn, "Saving...", async () => {
-          try {
-            const parsed = JSON.parse(manifestEl.value);
-            await apiRequest("/manifest", {
-              method: "PUT",
-              headers: {
-                "Content-Type": "application/json",
-                "X-Agent-Vault-Token": authToken
-              },
-              body: JSON.stringify({ manifest: parsed })
-            });
-            setStatus("Manifest saved", "success");
-            await loadProviders();
-          } catch (error) {
-            setStatus(error.message, "error");
-          }
-        })
-      );
-
-      async function init() {
-        applyTheme(getInitialTheme());
-        try {
-          const imported = await applySharedManifestFromUrl();
-          if (!imported) {
-            await loadManifest();
-          }
-          await loadProviders();
-          await loadShareMetrics();
-          if (!imported) {
-            setStatus("Dashboard ready", "success");
-          }
-        } catch (error) {
-          setStatus(error.message, "error");
-        }
-      }
-
-      init();
-    </script>
-  </body>
-</html>
-""".replace("__AUTH_TOKEN__", token_json)
+    return _DASHBOARD_TEMPLATE.replace("__AUTH_TOKEN__", json.dumps(auth_token))
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import functools
 import secrets
 import webbrowser
+from collections.abc import Callable
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
@@ -13,6 +17,11 @@ from agent_vault.runner import RunnerError, parse_command, run_with_env
 from agent_vault.service import AgentVaultService, ServiceError
 from agent_vault.vault import VaultError
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+    from agent_vault.api import DashboardService
+
 app = typer.Typer(help="Agent Vault: local-first secrets manager for agent runtimes")
 console = Console()
 vault_service = AgentVaultService(MANIFEST_PATH, SERVICE_NAME)
@@ -20,6 +29,15 @@ vault_service = AgentVaultService(MANIFEST_PATH, SERVICE_NAME)
 LOOPBACK_HOSTS = {"127.0.0.1", "localhost", "::1"}
 
 
+@functools.cache
+def _load_server() -> tuple[Callable[[DashboardService, str], FastAPI], ModuleType]:
+    import uvicorn
+
+    from agent_vault.api import create_app
+
+    return create_app, uvicorn
+
+
 @app.command("init")
 def init_manifest() -> None:
     """Initialize ~/.config/ai/ai_agents/manifest.json if missing."""
@@ -47,7 +65,8 @@ def set_key(provider: str) -> None:
 def doctor() -> None:
     """Run basic local health checks."""
     try:
-        statuses = vault_service.list_provider_statuses()
+        with vault_service.snapshot():
+            statuses = vault_service.list_provider_statuses()
     except (ManifestError, VaultError) as exc:
         console.print(f"[red]{exc}[/red]")
         raise typer.Exit(code=1) from exc
@@ -74,7 +93,8 @@ def run_command(
 ) -> None:
     """Run a command with ephemeral env injection."""
     try:
-        run_context = vault_service.build_run_context(provider)
+        with vault_service.snapshot():
+            run_context = vault_service.build_run_context(provider)
         code = run_with_env(parse_command(command), run_context.injected_env)
         raise typer.Exit(code=code)
 
@@ -93,6 +113,7 @@ def dashboard(
         "--auth-token",
         help="Optional API auth token for mutating endpoints",
     ),
+    verbose: bool = typer.Option(False, "--verbose", help="Enable server and access logs"),
 ) -> None:
     """Run the local dashboard and API server."""
     if host not in LOOPBACK_HOSTS:
@@ -103,8 +124,7 @@ def dashboard(
     url = f"http://{host}:{port}"
 
     try:
-        from agent_vault.api import create_app
-        import uvicorn
+        create_app, uvicorn = _load_server()
     except ImportError as exc:
         console.print(f"[red]Missing dashboard dependencies: {exc}[/red]")
         raise typer.Exit(code=1) from exc
@@ -117,7 +137,13 @@ def dashboard(
         webbrowser.open(url, new=1, autoraise=True)
 
     try:
-        uvicorn.run(create_app(vault_service, token), host=host, port=port, log_level="info")
+        uvicorn.run(
+            create_app(vault_service, token),
+            host=host,
+            port=port,
+            log_level="info" if verbose else "warning",
+            access_log=verbose,
+        )
     except OSError as exc:
         console.print(f"[red]{exc}[/red]")
         raise typer.Exit(code=1) from exc
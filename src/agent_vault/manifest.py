@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-import json
+import contextlib
+import os
+import stat
+import tempfile
 from pathlib import Path
 
+import orjson
 from pydantic import ValidationError
 
 from agent_vault.models import Manifest
@@ -13,20 +17,36 @@ class ManifestError(RuntimeError):
 
 
 def load_manifest(path: Path) -> Manifest:
-    if not path.exists():
-        raise ManifestError(f"Manifest not found at {path}")
-
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ManifestError(f"Invalid JSON in manifest: {exc}") from exc
+        raw = path.read_bytes()
+    except (FileNotFoundError, NotADirectoryError) as exc:
+        raise ManifestError(f"Manifest not found at {path}") from exc
 
     try:
-        return Manifest.model_validate(data)
+        return Manifest.model_validate_json(raw)
     except ValidationError as exc:
+        if any(error["type"] == "json_invalid" for error in exc.errors()):
+            raise ManifestError(f"Invalid JSON in manifest: {exc}") from exc
         raise ManifestError(f"Manifest validation failed: {exc}") from exc
 
 
 def write_manifest(path: Path, manifest: Manifest) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
+    data = orjson.dumps(manifest.model_dump(), option=orjson.OPT_INDENT_2)
+
+    # A private temp file per writer: concurrent saves each rename a complete file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            # Keep the permissions of the manifest being replaced; a brand-new
+            # manifest keeps mkstemp's owner-only mode.
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(tmp_name, stat.S_IMODE(path.stat().st_mode))
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
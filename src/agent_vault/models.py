@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
-
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 ProviderType = Literal["upstream", "gateway", "local", "free_tier"]
+UNRANKED_PRIORITY = 10_000
 
 
 class ProviderConfig(BaseModel):
+    # Build validators on first use so CLI paths that never validate skip the cost.
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     vault_key: str | None = None
     env_var: str | None = None
     type: ProviderType
@@ -17,6 +20,21 @@ class ProviderConfig(BaseModel):
 
 
 class Manifest(BaseModel):
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     version: str = Field(min_length=1)
     identity: str | None = None
     providers: dict[str, ProviderConfig]
+
+    @field_validator("providers")
+    @classmethod
+    def _order_by_priority(cls, providers: dict[str, ProviderConfig]) -> dict[str, ProviderConfig]:
+        # Stable sort: providers with equal priority keep their manifest order.
+        return dict(
+            sorted(
+                providers.items(),
+                key=lambda item: (
+                    item[1].priority if item[1].priority is not None else UNRANKED_PRIORITY
+                ),
+            )
+        )
@@ -13,10 +13,8 @@ def resolve_provider(manifest: Manifest, explicit_provider: str | None) -> str:
             raise PolicyError(f"Unknown provider: {explicit_provider}")
         return explicit_provider
 
-    ranked = sorted(
-        manifest.providers.items(),
-        key=lambda item: item[1].priority if item[1].priority is not None else 10_000,
-    )
-    if not ranked:
+    if not manifest.providers:
         raise PolicyError("No providers configured")
-    return ranked[0][0]
+
+    # Manifest keeps providers in priority order, so the first one wins.
+    return next(iter(manifest.providers))
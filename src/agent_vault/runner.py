@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import os
+import re
 import shlex
 import subprocess
 
+# Quotes, escapes, or whitespace that shlex does not split on.
+_NEEDS_SHLEX = re.compile(r"[\"'\\]|[^\S \t\r\n]")
+
 
 class RunnerError(RuntimeError):
     pass
@@ -13,15 +17,15 @@ def run_with_env(command: list[str], injected_env: dict[str, str]) -> int:
     if not command:
         raise RunnerError("No command provided")
 
-    env = os.environ.copy()
-    env.update(injected_env)
+    # With nothing to inject the child simply inherits the parent environment.
+    env = {**os.environ, **injected_env} if injected_env else None
 
     result = subprocess.run(command, env=env, check=False)
     return result.returncode
 
 
 def parse_command(raw: str) -> list[str]:
-    parts = shlex.split(raw)
+    parts = shlex.split(raw) if _NEEDS_SHLEX.search(raw) else raw.split()
     if not parts:
         raise RunnerError("Command parsing produced no arguments")
     return parts
@@ -1,22 +1,53 @@
 from __future__ import annotations
 
+import errno
+import os
+import selectors
 import socket
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import Any, NamedTuple
 
 from agent_vault.manifest import load_manifest, write_manifest
-from agent_vault.models import Manifest, ProviderConfig
+from agent_vault.models import UNRANKED_PRIORITY, Manifest, ProviderConfig
 from agent_vault.policy import resolve_provider
 from agent_vault.vault import delete_secret, get_secret, has_secret, set_secret
 
+MAX_PROBE_WORKERS = 8
+PROBE_TIMEOUT_SECONDS = 1.0
+LOOPBACK_PROBE_TIMEOUT_SECONDS = 0.1
+DNS_CACHE_TTL_SECONDS = 30.0
+DNS_NEGATIVE_CACHE_TTL_SECONDS = 5.0
+_DEFAULT_PORTS = {"https": 443, "wss": 443, "http": 80, "ws": 80}
+_CONNECT_PENDING = frozenset({errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY})
+
+_AddrInfo = tuple[
+    socket.AddressFamily,
+    socket.SocketKind,
+    int,
+    str,
+    tuple[str, int] | tuple[str, int, int, int] | tuple[int, bytes],
+]
+_DNS_CACHE: dict[tuple[str, int], tuple[float, Sequence[_AddrInfo]]] = {}
+_LOOPBACK_ADDRESSES: dict[str, tuple[tuple[socket.AddressFamily, str], ...]] = {
+    # Dual-stack dev servers may bind "localhost" to ::1 only.
+    "localhost": ((socket.AF_INET, "127.0.0.1"), (socket.AF_INET6, "::1")),
+    "127.0.0.1": ((socket.AF_INET, "127.0.0.1"),),
+    "::1": ((socket.AF_INET6, "::1"),),
+}
+
 
 class ServiceError(RuntimeError):
     pass
 
 
-@dataclass(frozen=True, slots=True)
-class ProviderStatus:
+class ProviderStatus(NamedTuple):
     name: str
     provider_type: str
     env_var: str | None
@@ -26,9 +57,20 @@ class ProviderStatus:
     has_secret: bool | None
     endpoint_reachable: bool | None
 
+    def as_public_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.provider_type,
+            "env_var": self.env_var,
+            "vault_key": self.vault_key,
+            "endpoint": self.endpoint,
+            "priority": self.priority,
+            "has_secret": self.has_secret,
+            "endpoint_reachable": self.endpoint_reachable,
+        }
 
-@dataclass(frozen=True, slots=True)
-class ProviderTestResult:
+
+class ProviderTestResult(NamedTuple):
     provider: str
     has_secret: bool | None
     endpoint_reachable: bool | None
@@ -72,56 +114,103 @@ def default_manifest() -> Manifest:
     )
 
 
+class _SnapshotState(threading.local):
+    manifest: Manifest | None = None
+    secret_presence: dict[str, bool] | None = None
+
+
 class AgentVaultService:
     def __init__(self, manifest_path: Path, service_name: str) -> None:
         self._manifest_path = manifest_path
         self._service_name = service_name
+        self._manifest_cache: tuple[tuple[int, int], Manifest] | None = None
+        self._snapshot = _SnapshotState()
 
     def init_manifest(self) -> bool:
         if self._manifest_path.exists():
             return False
 
         write_manifest(self._manifest_path, default_manifest())
+        self._manifest_cache = None
         return True
 
     def load_manifest(self) -> Manifest:
-        return load_manifest(self._manifest_path)
+        """Return the parsed manifest, reusing it while the file is unchanged.
+
+        The cached instance is shared by every caller (and by ``snapshot``). Frozen
+        models only reject attribute assignment; ``providers`` is still a plain
+        dict, so callers must treat the result as read-only and go through
+        ``save_manifest`` to change it.
+        """
+        try:
+            stat = os.stat(self._manifest_path)
+        except OSError:
+            # Let the loader raise its usual ManifestError.
+            return load_manifest(self._manifest_path)
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._manifest_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        manifest = load_manifest(self._manifest_path)
+        self._manifest_cache = (key, manifest)
+        return manifest
 
     def save_manifest(self, manifest: Manifest) -> None:
         write_manifest(self._manifest_path, manifest)
+        self._manifest_cache = None
+
+    @contextmanager
+    def snapshot(self) -> Iterator[Manifest]:
+        """Serve every read on this thread from one manifest load until exit."""
+        if self._snapshot.manifest is not None:
+            yield self._snapshot.manifest
+            return
+
+        self._snapshot.manifest = self.load_manifest()
+        self._snapshot.secret_presence = {}
+        try:
+            yield self._snapshot.manifest
+        finally:
+            self._snapshot.manifest = None
+            self._snapshot.secret_presence = None
 
     def list_provider_statuses(self) -> list[ProviderStatus]:
-        manifest = self.load_manifest()
-        statuses: list[ProviderStatus] = []
+        manifest = self._current_manifest()
+        reachability = self._probe_endpoints(
+            config.endpoint for config in manifest.providers.values() if config.endpoint
+        )
+        # One keyring lookup per distinct key; providers without a key never touch the keyring.
+        vault_keys = dict.fromkeys(
+            config.vault_key for config in manifest.providers.values() if config.vault_key
+        )
+        presence = {vault_key: self._cached_has_secret(vault_key) for vault_key in vault_keys}
+        ranked: list[tuple[tuple[int, str], ProviderStatus]] = []
         for provider_name, config in manifest.providers.items():
             has_provider_secret: bool | None = None
             if config.vault_key:
-                has_provider_secret = has_secret(self._service_name, config.vault_key)
+                has_provider_secret = presence[config.vault_key]
 
             endpoint_reachable: bool | None = None
             if config.endpoint:
-                endpoint_reachable = self._is_endpoint_reachable(config.endpoint)
-
-            statuses.append(
-                ProviderStatus(
-                    name=provider_name,
-                    provider_type=config.type,
-                    env_var=config.env_var,
-                    vault_key=config.vault_key,
-                    endpoint=config.endpoint,
-                    priority=config.priority,
-                    has_secret=has_provider_secret,
-                    endpoint_reachable=endpoint_reachable,
-                )
+                endpoint_reachable = reachability[config.endpoint]
+
+            status = ProviderStatus(
+                name=provider_name,
+                provider_type=config.type,
+                env_var=config.env_var,
+                vault_key=config.vault_key,
+                endpoint=config.endpoint,
+                priority=config.priority,
+                has_secret=has_provider_secret,
+                endpoint_reachable=endpoint_reachable,
             )
+            rank = config.priority if config.priority is not None else UNRANKED_PRIORITY
+            ranked.append(((rank, provider_name), status))
 
-        return sorted(
-            statuses,
-            key=lambda status: (
-                status.priority if status.priority is not None else 10_000,
-                status.name,
-            ),
-        )
+        ranked.sort(key=itemgetter(0))
+        return [status for _, status in ranked]
 
     def set_provider_secret(self, provider: str, secret: str) -> None:
         if not secret.strip():
@@ -132,12 +221,15 @@ class AgentVaultService:
             raise ServiceError(f"Provider has no vault_key: {provider}")
 
         set_secret(self._service_name, config.vault_key, secret)
+        self._forget_secret_presence(config.vault_key)
 
     def delete_provider_secret(self, provider: str) -> bool:
         config = self._provider_config(provider)
         if not config.vault_key:
             raise ServiceError(f"Provider has no vault_key: {provider}")
-        return delete_secret(self._service_name, config.vault_key)
+        deleted = delete_secret(self._service_name, config.vault_key)
+        self._forget_secret_presence(config.vault_key)
+        return deleted
 
     def test_provider(self, provider: str) -> ProviderTestResult:
         config = self._provider_config(provider)
@@ -145,7 +237,7 @@ class AgentVaultService:
 
         secret_status: bool | None = None
         if config.vault_key:
-            secret_status = has_secret(self._service_name, config.vault_key)
+            secret_status = self._cached_has_secret(config.vault_key)
             if not secret_status:
                 failures.append("missing secret")
 
@@ -163,7 +255,7 @@ class AgentVaultService:
         )
 
     def build_run_context(self, provider_override: str | None) -> RunContext:
-        manifest = self.load_manifest()
+        manifest = self._current_manifest()
         chosen = resolve_provider(manifest, provider_override)
         config = manifest.providers[chosen]
 
@@ -173,30 +265,133 @@ class AgentVaultService:
 
         return RunContext(provider=chosen, injected_env=injected_env)
 
+    def _current_manifest(self) -> Manifest:
+        if self._snapshot.manifest is not None:
+            return self._snapshot.manifest
+        return self.load_manifest()
+
+    def _cached_has_secret(self, vault_key: str) -> bool:
+        presence = self._snapshot.secret_presence
+        if presence is None:
+            return has_secret(self._service_name, vault_key)
+        if vault_key not in presence:
+            presence[vault_key] = has_secret(self._service_name, vault_key)
+        return presence[vault_key]
+
+    def _forget_secret_presence(self, vault_key: str) -> None:
+        if self._snapshot.secret_presence is not None:
+            self._snapshot.secret_presence.pop(vault_key, None)
+
     def _provider_config(self, provider: str) -> ProviderConfig:
-        manifest = self.load_manifest()
+        manifest = self._current_manifest()
         config = manifest.providers.get(provider)
         if config is None:
             raise ServiceError(f"Provider not found: {provider}")
         return config
 
+    def _probe_endpoints(self, endpoints: Iterable[str]) -> dict[str, bool]:
+        unique = list(dict.fromkeys(endpoints))
+        if len(unique) <= 1:
+            return {endpoint: self._is_endpoint_reachable(endpoint) for endpoint in unique}
+
+        # Probes are I/O-bound; run them together so latency is the slowest, not the sum.
+        with ThreadPoolExecutor(max_workers=min(MAX_PROBE_WORKERS, len(unique))) as pool:
+            return dict(zip(unique, pool.map(self._is_endpoint_reachable, unique), strict=True))
+
     @staticmethod
     def _is_endpoint_reachable(endpoint: str) -> bool:
-        parsed = urlparse(endpoint)
-        host = parsed.hostname
-        if not host:
+        parsed = _split_endpoint(endpoint)
+        if parsed is None:
             return False
 
-        port = parsed.port
+        scheme, host, port = parsed
         if port is None:
-            if parsed.scheme in {"https", "wss"}:
-                port = 443
-            elif parsed.scheme in {"http", "ws"}:
-                port = 80
-            else:
+            port = _DEFAULT_PORTS.get(scheme)
+            if port is None:
                 return False
-        try:
-            with socket.create_connection((host, port), timeout=1.0):
-                return True
-        except OSError:
-            return False
+
+        # Loopback needs neither a resolver round-trip nor a WAN-sized timeout.
+        loopback = _LOOPBACK_ADDRESSES.get(host)
+        if loopback is not None:
+            return any(
+                _try_connect(
+                    family, socket.SOCK_STREAM, 0, (address, port), LOOPBACK_PROBE_TIMEOUT_SECONDS
+                )
+                for family, address in loopback
+            )
+
+        return any(
+            _try_connect(family, kind, proto, sockaddr, PROBE_TIMEOUT_SECONDS)
+            for family, kind, proto, _, sockaddr in _resolve(host, port)
+        )
+
+
+def _try_connect(
+    family: int,
+    kind: int,
+    proto: int,
+    sockaddr: tuple[str, int] | tuple[str, int, int, int] | tuple[int, bytes],
+    timeout: float,
+) -> bool:
+    try:
+        sock = socket.socket(family, kind, proto)
+    except OSError:
+        return False
+    with sock, selectors.DefaultSelector() as selector:
+        sock.setblocking(False)
+        # connect_ex reports refusals as an errno instead of raising, and the
+        # selector wait lets an unresponsive host be abandoned at the deadline.
+        err = sock.connect_ex(sockaddr)
+        if err in _CONNECT_PENDING:
+            selector.register(sock, selectors.EVENT_WRITE)
+            if not selector.select(timeout):
+                return False
+            err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        return err == 0
+
+
+def _resolve(host: str, port: int) -> Sequence[_AddrInfo]:
+    now = time.monotonic()
+    cached = _DNS_CACHE.get((host, port))
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    infos: Sequence[_AddrInfo]
+    try:
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except OSError:
+        infos = []
+    # Failed lookups expire sooner so a transient resolver outage clears quickly.
+    ttl = DNS_CACHE_TTL_SECONDS if infos else DNS_NEGATIVE_CACHE_TTL_SECONDS
+    _DNS_CACHE[(host, port)] = (now + ttl, infos)
+    return infos
+
+
+def _split_endpoint(endpoint: str) -> tuple[str, str, int | None] | None:
+    # Only scheme, host and port are needed, so skip the general-purpose urlparse.
+    scheme, sep, rest = endpoint.partition("://")
+    if not sep:
+        return None
+
+    authority = rest
+    for delimiter in "/?#":
+        authority = authority.partition(delimiter)[0]
+    authority = authority.rpartition("@")[2]
+
+    if authority.startswith("["):
+        host, sep, tail = authority[1:].partition("]")
+        if not sep or (tail and not tail.startswith(":")):
+            return None
+        port_text = tail[1:]
+    else:
+        host, _, port_text = authority.partition(":")
+
+    if not host:
+        return None
+
+    port: int | None = None
+    if port_text:
+        if not (port_text.isascii() and port_text.isdigit()) or int(port_text) > 65535:
+            return None
+        port = int(port_text)
+    return scheme.lower(), host.lower(), port
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import functools
+
 import keyring
+from keyring.backend import KeyringBackend
 from keyring.errors import KeyringError, PasswordDeleteError
 
 
@@ -8,16 +11,28 @@ class VaultError(RuntimeError):
     pass
 
 
+@functools.cache
+def _backend() -> KeyringBackend:
+    # Resolved on first use rather than at import so commands that never
+    # touch the keyring do not pay for backend discovery.
+    return keyring.get_keyring()
+
+
+def reset_backend() -> None:
+    """Forget the bound backend so the next call picks up ``keyring.set_keyring``."""
+    _backend.cache_clear()
+
+
 def set_secret(service: str, key: str, value: str) -> None:
     try:
-        keyring.set_password(service, key, value)
+        _backend().set_password(service, key, value)
     except KeyringError as exc:
         raise VaultError(str(exc)) from exc
 
 
 def get_secret(service: str, key: str) -> str:
     try:
-        secret = keyring.get_password(service, key)
+        secret = _backend().get_password(service, key)
     except KeyringError as exc:
         raise VaultError(str(exc)) from exc
 
@@ -28,7 +43,7 @@ def get_secret(service: str, key: str) -> str:
 
 def has_secret(service: str, key: str) -> bool:
     try:
-        secret = keyring.get_password(service, key)
+        secret = _backend().get_password(service, key)
     except KeyringError as exc:
         raise VaultError(str(exc)) from exc
     return bool(secret)
@@ -36,7 +51,7 @@ def has_secret(service: str, key: str) -> bool:
 
 def delete_secret(service: str, key: str) -> bool:
     try:
-        keyring.delete_password(service, key)
+        _backend().delete_password(service, key)
     except PasswordDeleteError:
         return False
     except KeyringError as exc:
@@ -5,6 +5,7 @@ from fastapi.testclient import TestClient
 from agent_vault.api import create_app
 from agent_vault.models import Manifest, ProviderConfig
 from agent_vault.service import ProviderStatus, ProviderTestResult, ServiceError
+from agent_vault.vault import VaultError
 
 
 class FakeService:
@@ -63,6 +64,36 @@ class FakeService:
         self.manifest = manifest
 
 
+def test_dashboard_embeds_auth_token() -> None:
+    service = FakeService()
+    client = TestClient(create_app(service, "topsecret"))
+
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert '"topsecret"' in response.text
+    assert "__AUTH_TOKEN__" not in response.text
+
+
+def test_dashboard_serves_precompressed_gzip() -> None:
+    service = FakeService()
+    client = TestClient(create_app(service, "topsecret"))
+
+    gzip_response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    identity_response = client.get("/", headers={"Accept-Encoding": "identity"})
+    explicit_response = client.get("/", headers={"Accept-Encoding": "*;q=0, gzip"})
+    weighted_response = client.get("/", headers={"Accept-Encoding": "gzip; Q=0.5"})
+    refused_response = client.get("/", headers={"Accept-Encoding": "gzip;q=0, *"})
+
+    assert gzip_response.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in identity_response.headers
+    assert explicit_response.headers["content-encoding"] == "gzip"
+    assert weighted_response.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in refused_response.headers
+    assert gzip_response.text == identity_response.text
+
+
 def test_mutating_endpoints_require_token() -> None:
     service = FakeService()
     client = TestClient(create_app(service, "topsecret"))
@@ -74,6 +105,25 @@ def test_mutating_endpoints_require_token() -> None:
     assert track_event_response.status_code == 401
 
 
+def test_mutating_endpoints_reject_wrong_token() -> None:
+    service = FakeService()
+    client = TestClient(create_app(service, "topsecret"))
+
+    wrong_length = client.post(
+        "/events/share",
+        json={"event": "manifest_share_link_copied"},
+        headers={"X-Agent-Vault-Token": "top"},
+    )
+    same_length = client.post(
+        "/events/share",
+        json={"event": "manifest_share_link_copied"},
+        headers={"X-Agent-Vault-Token": "topsecreX"},
+    )
+
+    assert wrong_length.status_code == 401
+    assert same_length.status_code == 401
+
+
 def test_set_provider_secret_with_token() -> None:
     service = FakeService()
     client = TestClient(create_app(service, "topsecret"))
@@ -88,6 +138,105 @@ def test_set_provider_secret_with_token() -> None:
     assert service.secret_by_provider["openai_pro"] == "abc123"
 
 
+def test_list_providers_payload() -> None:
+    service = FakeService()
+    client = TestClient(create_app(service, "topsecret"))
+
+    response = client.get("/providers")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "providers": [
+            {
+                "name": "openai_pro",
+                "type": "upstream",
+                "env_var": "OPENAI_API_KEY",
+                "vault_key": "api.openai.com/pro_key",
+                "endpoint": None,
+                "priority": 1,
+                "has_secret": False,
+                "endpoint_reachable": None,
+            }
+        ]
+    }
+
+
+def test_provider_listing_refreshes_after_write() -> None:
+    service = FakeService()
+    client = TestClient(create_app(service, "topsecret"))
+
+    before = client.get("/providers").json()["providers"][0]["has_secret"]
+    client.post(
+        "/providers/openai_pro/secret",
+        json={"secret": "abc123"},
+        headers={"X-Agent-Vault-Token": "topsecret"},
+    )
+    after = client.get("/providers").json()["providers"][0]["has_secret"]
+
+    assert before is False
+    assert after is True
+
+
+def test_provider_test_payload() -> None:
+    service = FakeService()
+    client = TestClient(create_app(service, "topsecret"))
+
+    response = client.post("/providers/openai_pro/test")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "provider": "openai_pro",
+        "ok": False,
+        "has_secret": False,
+        "endpoint_reachable": None,
+        "failures": ["missing secret"],
+    }
+
+
+def test_preserialized_routes_keep_response_schemas() -> None:
+    client = TestClient(create_app(FakeService(), "topsecret"))
+
+    paths = client.get("/openapi.json").json()["paths"]
+
+    expected = {
+        ("/providers", "get"): "ProviderListResponse",
+        ("/manifest", "get"): "ManifestResponse",
+        ("/providers/{provider}/test", "post"): "ProviderTestResponse",
+    }
+    for (path, method), model in expected.items():
+        schema = paths[path][method]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert schema == {"$ref": f"#/components/schemas/{model}"}
+
+
+def test_service_errors_map_to_bad_request() -> None:
+    service = FakeService()
+    client = TestClient(create_app(service, "topsecret"))
+
+    response = client.delete(
+        "/providers/unknown/secret",
+        headers={"X-Agent-Vault-Token": "topsecret"},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Provider not found"}
+
+
+def test_vault_errors_map_to_server_error() -> None:
+    service = FakeService()
+
+    def broken_keyring(provider: str) -> ProviderTestResult:
+        raise VaultError("keyring unavailable")
+
+    service.test_provider = broken_keyring  # type: ignore[method-assign]
+    client = TestClient(create_app(service, "topsecret"))
+
+    response = client.post("/providers/openai_pro/test")
+
+    assert response.status_code == 500
+    assert response.json() == {"detail": "keyring unavailable"}
+
+
 def test_manifest_roundtrip() -> None:
     service = FakeService()
     client = TestClient(create_app(service, "topsecret"))
@@ -1,6 +1,12 @@
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from agent_vault.manifest import load_manifest
+import pytest
+
+from agent_vault.manifest import ManifestError, load_manifest, write_manifest
+from agent_vault.models import Manifest, ProviderConfig
 
 
 def test_load_manifest(tmp_path: Path) -> None:
@@ -14,3 +20,92 @@ def test_load_manifest(tmp_path: Path) -> None:
 
     assert manifest.version == "2026.1"
     assert "p" in manifest.providers
+
+
+def test_load_manifest_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(ManifestError, match="Manifest not found"):
+        load_manifest(tmp_path / "manifest.json")
+
+
+def test_load_manifest_under_file_parent(tmp_path: Path) -> None:
+    parent = tmp_path / "file"
+    parent.write_text("", encoding="utf-8")
+
+    with pytest.raises(ManifestError, match="Manifest not found"):
+        load_manifest(parent / "manifest.json")
+
+
+def test_load_manifest_rejects_invalid_json(tmp_path: Path) -> None:
+    file = tmp_path / "manifest.json"
+    file.write_text("{not json", encoding="utf-8")
+
+    with pytest.raises(ManifestError, match="Invalid JSON in manifest"):
+        load_manifest(file)
+
+
+def test_load_manifest_rejects_invalid_schema(tmp_path: Path) -> None:
+    file = tmp_path / "manifest.json"
+    file.write_text('{"version":"","providers":{}}', encoding="utf-8")
+
+    with pytest.raises(ManifestError, match="Manifest validation failed"):
+        load_manifest(file)
+
+
+def test_write_manifest_roundtrip(tmp_path: Path) -> None:
+    file = tmp_path / "manifest.json"
+    manifest = Manifest(
+        version="2026.1",
+        providers={"p": ProviderConfig(type="upstream", vault_key="api.provider/p")},
+    )
+
+    write_manifest(file, manifest)
+
+    assert load_manifest(file) == manifest
+    assert file.read_text(encoding="utf-8") == manifest.model_dump_json(indent=2)
+    assert list(tmp_path.iterdir()) == [file]
+
+
+def test_write_manifest_survives_concurrent_writers(tmp_path: Path) -> None:
+    file = tmp_path / "manifest.json"
+    manifests = [
+        Manifest(version=f"2026.{n}", providers={"p": ProviderConfig(type="local")})
+        for n in range(1, 5)
+    ]
+
+    def write_many(manifest: Manifest) -> Manifest:
+        for _ in range(30):
+            write_manifest(file, manifest)
+            assert load_manifest(file) in manifests
+        return manifest
+
+    with ThreadPoolExecutor(max_workers=len(manifests)) as pool:
+        assert list(pool.map(write_many, manifests)) == manifests
+
+    assert load_manifest(file) in manifests
+    assert list(tmp_path.iterdir()) == [file]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_write_manifest_keeps_existing_permissions(tmp_path: Path) -> None:
+    file = tmp_path / "manifest.json"
+    manifest = Manifest(version="2026.1", providers={})
+    write_manifest(file, manifest)
+    file.chmod(0o640)
+
+    write_manifest(file, manifest)
+
+    assert stat.S_IMODE(file.stat().st_mode) == 0o640
+
+
+def test_manifest_orders_providers_by_priority() -> None:
+    manifest = Manifest(
+        version="2026.1",
+        providers={
+            "unranked": ProviderConfig(type="local"),
+            "second": ProviderConfig(type="upstream", priority=2),
+            "first": ProviderConfig(type="upstream", priority=1),
+            "tied": ProviderConfig(type="gateway", priority=2),
+        },
+    )
+
+    assert list(manifest.providers) == ["first", "second", "tied", "unranked"]
@@ -1,5 +1,7 @@
+import pytest
+
 from agent_vault.models import Manifest, ProviderConfig
-from agent_vault.policy import resolve_provider
+from agent_vault.policy import PolicyError, resolve_provider
 
 
 def test_resolve_by_priority() -> None:
@@ -12,3 +14,21 @@ def test_resolve_by_priority() -> None:
     )
 
     assert resolve_provider(manifest, None) == "a"
+
+
+def test_resolve_keeps_first_provider_on_priority_tie() -> None:
+    manifest = Manifest(
+        version="2026.1",
+        providers={
+            "z": ProviderConfig(type="upstream", priority=1),
+            "a": ProviderConfig(type="upstream", priority=1),
+            "unranked": ProviderConfig(type="local"),
+        },
+    )
+
+    assert resolve_provider(manifest, None) == "z"
+
+
+def test_resolve_without_providers() -> None:
+    with pytest.raises(PolicyError, match="No providers configured"):
+        resolve_provider(Manifest(version="2026.1", providers={}), None)
@@ -0,0 +1,37 @@
+import os
+import shlex
+import sys
+
+import pytest
+
+from agent_vault.runner import RunnerError, parse_command, run_with_env
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "python -m http.server 8000",
+        "  env\t|  grep  OPENAI_API_KEY \n",
+        "echo $HOME `date` a#b",
+        "echo 'hello world'",
+        'echo "a b" c\\ d',
+        "echo a\x0bb",
+    ],
+)
+def test_parse_command_matches_shlex(raw: str) -> None:
+    assert parse_command(raw) == shlex.split(raw)
+
+
+def test_parse_command_rejects_empty() -> None:
+    with pytest.raises(RunnerError):
+        parse_command("   ")
+
+
+def test_run_with_env_injects_only_into_child(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("AGENT_VAULT_TEST_KEY", raising=False)
+    check = "import os, sys; sys.exit(os.environ.get('AGENT_VAULT_TEST_KEY') != 'injected')"
+
+    code = run_with_env([sys.executable, "-c", check], {"AGENT_VAULT_TEST_KEY": "injected"})
+
+    assert code == 0
+    assert "AGENT_VAULT_TEST_KEY" not in os.environ
@@ -0,0 +1,42 @@
+import keyring
+import pytest
+from keyring.backend import KeyringBackend
+from keyring.errors import PasswordDeleteError
+
+from agent_vault import vault
+
+
+class MemoryKeyring(KeyringBackend):
+    priority = 1
+
+    def __init__(self) -> None:
+        self.store: dict[tuple[str, str], str] = {}
+
+    def get_password(self, service: str, username: str) -> str | None:
+        return self.store.get((service, username))
+
+    def set_password(self, service: str, username: str, password: str) -> None:
+        self.store[(service, username)] = password
+
+    def delete_password(self, service: str, username: str) -> None:
+        if self.store.pop((service, username), None) is None:
+            raise PasswordDeleteError(username)
+
+
+def test_secret_round_trip_uses_bound_backend() -> None:
+    previous = keyring.get_keyring()
+    backend = MemoryKeyring()
+    keyring.set_keyring(backend)
+    vault.reset_backend()
+    try:
+        vault.set_secret("svc", "k", "value")
+        assert backend.store == {("svc", "k"): "value"}
+        assert vault.has_secret("svc", "k")
+        assert vault.get_secret("svc", "k") == "value"
+        assert vault.delete_secret("svc", "k")
+        assert not vault.delete_secret("svc", "k")
+        with pytest.raises(vault.VaultError, match="No secret found"):
+            vault.get_secret("svc", "k")
+    finally:
+        keyring.set_keyring(previous)
+        vault.reset_backend()